@@ -4,6 +4,7 @@ import pygame
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 GROUND_HEIGHT = 500
+FPS = 60
 
 # Game physics
 GRAVITY = 0.8
@@ -14,6 +15,9 @@ MIN_OBSTACLE_DISTANCE = 300
 # Sound settings
 SOUND_THRESHOLD = 0.01
 SOUND_AMPLIFICATION = 8.0
+SOUND_BUFFER_SIZE = 3
+SMOOTHING_AVG_WEIGHT = 0.3
+SMOOTHING_CURRENT_WEIGHT = 0.7
 
 # Colors
 WHITE = (255, 255, 255)
@@ -27,5 +31,4 @@ YELLOW = (255, 255, 0)
 # Audio settings
 CHUNK_SIZE = 512
 CHANNELS = 1
-RATE = 44100
-FORMAT = pygame.paFloat32 
\ No newline at end of file
+RATE = 44100
\ No newline at end of file
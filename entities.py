@@ -1,6 +1,7 @@
 import pygame
 import random
 import math
+import time
 from constants import *
 
 class Hen:
@@ -12,11 +13,13 @@ class Hen:
         self.velocity = 0
         self.is_jumping = False
         self.facing_right = True
-        self.last_jump_time = 0
         self.jump_cooldown = 0.05
+        # Ready to jump straight away, whatever clock jump() is driven by
+        self.last_jump_time = float("-inf")
         
-    def jump(self, intensity):
-        current_time = time.time()
+    def jump(self, intensity, current_time=None):
+        if current_time is None:
+            current_time = time.time()
         if not self.is_jumping and (current_time - self.last_jump_time) > self.jump_cooldown:
             jump_multiplier = min(2.5, 1.0 + (intensity * 3))
             self.velocity = -JUMP_POWER * jump_multiplier
@@ -81,7 +84,7 @@ class Hen:
             self.is_jumping = False
 
 class Obstacle:
-    def __init__(self):
+    def __init__(self, rng=random):
         self.width = 40
         self.height = 60
         self.x = WINDOW_WIDTH
@@ -98,8 +101,8 @@ class Obstacle:
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
 class Cactus(Obstacle):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=random):
+        super().__init__(rng)
         self.color = (0, 100, 0)  # Dark green
         
     def draw(self, screen):
@@ -113,9 +116,9 @@ class Cactus(Obstacle):
             ])
 
 class Tower(Obstacle):
-    def __init__(self):
-        super().__init__()
-        self.height = random.randint(40, 100)
+    def __init__(self, rng=random):
+        super().__init__(rng)
+        self.height = rng.randint(40, 100)
         self.y = GROUND_HEIGHT - self.height
         self.color = (100, 100, 100)
         
@@ -128,19 +131,19 @@ class Tower(Obstacle):
             pygame.draw.rect(screen, window_color, (self.x + 5, window_y, 10, 15))
 
 class BreakingGround(Obstacle):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=random):
+        super().__init__(rng)
         self.width = 60
         self.height = 20
         self.y = GROUND_HEIGHT - self.height
         self.color = BROWN
         self.cracks = []
-        self.generate_cracks()
+        self.generate_cracks(rng)
         
-    def generate_cracks(self):
+    def generate_cracks(self, rng=random):
         for _ in range(3):
-            crack_x = random.randint(0, self.width)
-            crack_y = random.randint(0, self.height)
+            crack_x = rng.randint(0, self.width)
+            crack_y = rng.randint(0, self.height)
             self.cracks.append((crack_x, crack_y))
             
     def draw(self, screen):
@@ -152,8 +155,8 @@ class BreakingGround(Obstacle):
                             self.y + crack_y + random.randint(-5, 5)), 2)
 
 class BouncingBall(Obstacle):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rng=random):
+        super().__init__(rng)
         self.width = 30
         self.height = 30
         self.y = GROUND_HEIGHT - self.height
@@ -182,6 +185,6 @@ class BouncingBall(Obstacle):
         pygame.draw.circle(screen, BLACK, 
                          (int(self.x + 2*self.width/3), int(self.y + self.height/3)), 2)
 
-def create_obstacle():
+def create_obstacle(rng=random):
     obstacle_types = [Cactus, Tower, BreakingGround, BouncingBall]
-    return random.choice(obstacle_types)() 
\ No newline at end of file
+    return rng.choice(obstacle_types)(rng) 
\ No newline at end of file
@@ -0,0 +1,164 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import copy
+import random
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+import pygame
+from constants import *
+from game import Game, draw_frame
+from feature_cache import FeatureCache
+
+FRAME_BYTES = WINDOW_WIDTH * WINDOW_HEIGHT * 3  # RGB24
+FRAMES_PER_TASK = 240
+
+# Per-worker rendering state, set up once by _init_worker
+_screen = None
+_font = None
+_game_over_font = None
+
+
+AUDIO_EXTENSIONS = (".wav", ".flac", ".ogg", ".mp3")
+
+
+def load_trace(path):
+    """Load an intensity trace with one value per CHUNK_SIZE audio chunk.
+
+    Audio recordings go through the feature cache, so their envelope is only
+    computed the first time a file is exported.
+    """
+    if path.lower().endswith(AUDIO_EXTENSIONS):
+        trace = FeatureCache().intensity(path)
+    elif path.endswith(".npy"):
+        trace = np.load(path, mmap_mode="r")
+    else:
+        trace = np.loadtxt(path, dtype=np.float32, ndmin=1)
+
+    if trace.ndim != 1:
+        raise ValueError(f"{path}: expected a 1-D intensity trace, got shape {trace.shape}")
+    return trace
+
+
+def frame_count(trace):
+    """Number of frames the session covers at FPS, one trace value per chunk."""
+    return int(len(trace) * CHUNK_SIZE / RATE * FPS)
+
+
+def simulate(seed, trace, restart_delay=2.0):
+    """Run the game logic headless and yield one snapshot per frame.
+
+    Drives the same Game as jumping_hen.py, but time advances by 1/FPS per
+    frame instead of following the wall clock, and the intensity for each
+    frame is the latest chunk of the trace, as SoundProcessor would report it.
+    After a game over the session restarts after restart_delay seconds, the
+    way a player pressing R would; pass None to keep the game over screen.
+    """
+    chunks_per_second = RATE / CHUNK_SIZE
+
+    # A private generator keeps spawning reproducible without touching the
+    # caller's global random state
+    game = Game(start_time=0.0, rng=random.Random(seed))
+    intensity = 0.0
+
+    for frame in range(frame_count(trace)):
+        current_time = frame / FPS
+
+        if (game.game_over and restart_delay is not None and
+                current_time - game.game_over_time >= restart_delay):
+            game.reset()
+
+        if not game.game_over:
+            intensity = float(trace[min(int(current_time * chunks_per_second), len(trace) - 1)])
+            game.step(intensity, current_time)
+
+        yield (copy.copy(game.hen), [copy.copy(o) for o in game.obstacles],
+               game.score, intensity, game.game_over)
+
+
+def _init_worker():
+    global _screen, _font, _game_over_font
+    pygame.init()
+    _screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    _font = pygame.font.Font(None, 36)
+    _game_over_font = pygame.font.Font(None, 72)
+
+
+def _render_range(seed, start, states, output, fmt, restart_prompt):
+    # Some obstacles draw with random jitter; seeding per task keeps the
+    # output identical regardless of how tasks land on workers.
+    random.seed(f"{seed}:{start}")
+    if fmt == "raw":
+        # Each task owns a contiguous slice of the preallocated file: seek
+        # once, then stream every frame out as soon as it is rendered so only
+        # one frame is held in memory at a time.
+        with open(output, "r+b") as f:
+            f.seek(start * FRAME_BYTES)
+            for state in states:
+                draw_frame(_screen, _font, _game_over_font, *state, restart_prompt=restart_prompt)
+                f.write(pygame.image.tobytes(_screen, "RGB"))
+    else:
+        for i, state in enumerate(states):
+            draw_frame(_screen, _font, _game_over_font, *state, restart_prompt=restart_prompt)
+            pygame.image.save(_screen, os.path.join(output, f"frame_{start + i:06d}.{fmt}"))
+    return len(states)
+
+
+def export(seed, trace, output, fmt="png", workers=None, restart_delay=2.0):
+    """Render a recorded session to disk using a pool of worker processes.
+
+    With fmt="raw" the frames are written back to back as RGB24 into a single
+    file at `output` (WINDOW_WIDTH x WINDOW_HEIGHT at FPS, ready for e.g.
+    ffmpeg -f rawvideo -pix_fmt rgb24); otherwise `output` is a directory
+    that receives one numbered image per frame.
+    """
+    if fmt == "raw":
+        with open(output, "wb") as f:
+            f.truncate(frame_count(trace) * FRAME_BYTES)
+    else:
+        os.makedirs(output, exist_ok=True)
+
+    workers = workers or os.cpu_count() or 1
+    # Sessions that restart on their own have nobody to press R
+    restart_prompt = restart_delay is None
+    written = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = set()
+        start = 0
+        states = []
+        for state in simulate(seed, trace, restart_delay):
+            states.append(state)
+            if len(states) == FRAMES_PER_TASK:
+                pending.add(pool.submit(_render_range, seed, start, states, output, fmt, restart_prompt))
+                start += len(states)
+                states = []
+                # Bound the number of snapshots held in memory
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    written += sum(f.result() for f in done)
+        if states:
+            pending.add(pool.submit(_render_range, seed, start, states, output, fmt, restart_prompt))
+        written += sum(f.result() for f in pending)
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a recorded session to frames offline")
+    parser.add_argument("trace", help="Audio recording, or intensity trace with one value per audio chunk (.npy or text)")
+    parser.add_argument("output", help="Output directory, or file when --format raw")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", default="png", choices=["png", "bmp", "tga", "raw"])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--restart-delay", type=float, default=2.0)
+    args = parser.parse_args()
+
+    trace = load_trace(args.trace)
+    frames = export(args.seed, trace, args.output, args.format, args.workers, args.restart_delay)
+    print(f"Exported {frames} frames to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+from constants import *
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "jumping_hen", "features")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+FEATURES = ("intensity", "onset")
+
+# Onset analysis uses one window per chunk so its frames line up with the
+# intensity envelope
+ONSET_N_FFT = CHUNK_SIZE
+ONSET_N_MELS = 64
+ONSET_LAG = 1
+
+
+def compute_intensity_envelope(samples):
+    """Per-chunk smoothed intensity, matching SoundProcessor._process_audio."""
+    n_chunks = len(samples) // CHUNK_SIZE
+    chunks = np.asarray(samples[:n_chunks * CHUNK_SIZE], dtype=np.float32).reshape(n_chunks, CHUNK_SIZE)
+    amplified_rms = np.sqrt(np.mean(np.square(chunks), axis=1)) * SOUND_AMPLIFICATION
+
+    # Rolling mean over the last SOUND_BUFFER_SIZE chunks, with the buffer
+    # still filling up for the first few chunks as it does live
+    cumsum = np.cumsum(np.concatenate(([0.0], amplified_rms)))
+    counts = np.minimum(np.arange(1, n_chunks + 1), SOUND_BUFFER_SIZE)
+    ends = np.arange(1, n_chunks + 1)
+    avg_intensity = (cumsum[ends] - cumsum[ends - counts]) / counts
+
+    smoothed = avg_intensity * SMOOTHING_AVG_WEIGHT + amplified_rms * SMOOTHING_CURRENT_WEIGHT
+    return smoothed.astype(np.float32)
+
+
+def compute_onset_envelope(samples):
+    """Onset strength with one value per CHUNK_SIZE chunk.
+
+    Frames are not centred, so onset[i] is computed from the same samples as
+    intensity chunk i (compared against the chunk ONSET_LAG before it).
+    """
+    import librosa
+
+    n_chunks = len(samples) // CHUNK_SIZE
+    if n_chunks == 0:
+        return np.zeros(0, dtype=np.float32)
+    onset = librosa.onset.onset_strength(y=samples, sr=RATE, hop_length=CHUNK_SIZE,
+                                         n_fft=ONSET_N_FFT, n_mels=ONSET_N_MELS,
+                                         lag=ONSET_LAG, center=False)
+    return np.asarray(onset[:n_chunks], dtype=np.float32)
+
+
+def load_audio(path):
+    """Decode an audio file to mono float32 samples at RATE."""
+    import librosa
+
+    samples, _ = librosa.load(path, sr=RATE, mono=True)
+    return samples
+
+
+def dsp_params():
+    return {
+        "version": CACHE_VERSION,
+        "chunk_size": CHUNK_SIZE,
+        "rate": RATE,
+        "amplification": SOUND_AMPLIFICATION,
+        "buffer_size": SOUND_BUFFER_SIZE,
+        "smoothing": [SMOOTHING_AVG_WEIGHT, SMOOTHING_CURRENT_WEIGHT],
+        "onset_n_fft": ONSET_N_FFT,
+        "onset_n_mels": ONSET_N_MELS,
+        "onset_lag": ONSET_LAG,
+    }
+
+
+class FeatureCache:
+    """On-disk cache of per-chunk audio features.
+
+    Entries are keyed by the audio file's content hash plus the DSP
+    parameters, stored as .npy files and loaded memory-mapped. Once the
+    directory grows past max_bytes the least recently used entries are
+    evicted.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._hashes = {}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _content_hash(self, path):
+        stat = os.stat(path)
+        stamp = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+        if stamp not in self._hashes:
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            self._hashes[stamp] = digest.hexdigest()
+        return self._hashes[stamp]
+
+    def key(self, path):
+        params = json.dumps(dsp_params(), sort_keys=True)
+        return hashlib.sha256(f"{self._content_hash(path)}:{params}".encode()).hexdigest()
+
+    def _entry_path(self, key, feature):
+        return os.path.join(self.cache_dir, f"{key}.{feature}.npy")
+
+    def get(self, path):
+        """Return a dict of memory-mapped feature arrays, computing them on a miss."""
+        key = self.key(path)
+        paths = {feature: self._entry_path(key, feature) for feature in FEATURES}
+        try:
+            features = {feature: np.load(p, mmap_mode="r") for feature, p in paths.items()}
+        except (FileNotFoundError, ValueError):
+            self._store(path, paths)
+            features = {feature: np.load(p, mmap_mode="r") for feature, p in paths.items()}
+            self.evict(keep=key)
+        # The mtime doubles as the last-used timestamp for eviction
+        for p in paths.values():
+            os.utime(p)
+        return features
+
+    def intensity(self, path):
+        return self.get(path)["intensity"]
+
+    def onset(self, path):
+        return self.get(path)["onset"]
+
+    def _store(self, path, paths):
+        samples = load_audio(path)
+        arrays = {
+            "intensity": compute_intensity_envelope(samples),
+            "onset": compute_onset_envelope(samples),
+        }
+        for feature, array in arrays.items():
+            tmp_path = f"{paths[feature]}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_path, paths[feature])
+
+    def evict(self, keep=None):
+        """Drop least recently used entries until the cache fits in max_bytes."""
+        entries = {}
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".npy"):
+                continue
+            key = name.split(".", 1)[0]
+            stat = os.stat(os.path.join(self.cache_dir, name))
+            size, last_used = entries.get(key, (0, 0))
+            entries[key] = (size + stat.st_size, max(last_used, stat.st_mtime))
+
+        total = sum(size for size, _ in entries.values())
+        for key, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            for feature in FEATURES:
+                try:
+                    os.remove(self._entry_path(key, feature))
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+    def clear(self):
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute audio feature envelopes into the cache")
+    parser.add_argument("audio", nargs="+", help="Audio files to process")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024))
+    args = parser.parse_args()
+
+    cache = FeatureCache(args.cache_dir, int(args.max_mb * 1024 * 1024))
+    for path in args.audio:
+        features = cache.get(path)
+        print(f"{path}: {len(features['intensity'])} chunks")
+
+if __name__ == "__main__":
+    main()
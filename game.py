@@ -0,0 +1,75 @@
+import random
+import time
+import pygame
+from constants import *
+from entities import Hen, create_obstacle
+
+class Game:
+    def __init__(self, start_time=None, rng=random):
+        self.rng = rng
+        self.last_obstacle_time = time.time() if start_time is None else start_time
+        self.game_over_time = None
+        self.reset()
+
+    def reset(self):
+        self.hen = Hen()
+        self.obstacles = []
+        self.score = 0
+        self.game_over = False
+
+    def step(self, intensity, current_time=None):
+        """Advance the game by one frame with the given sound intensity."""
+        if current_time is None:
+            current_time = time.time()
+
+        if intensity > SOUND_THRESHOLD:
+            self.hen.jump(intensity, current_time)
+
+        self.hen.update()
+
+        # Spawn obstacles every 2 seconds
+        if current_time - self.last_obstacle_time > 2:
+            if not self.obstacles or WINDOW_WIDTH - self.obstacles[-1].x > MIN_OBSTACLE_DISTANCE:
+                self.obstacles.append(create_obstacle(self.rng))
+                self.last_obstacle_time = current_time
+
+        hen = self.hen
+        for obstacle in self.obstacles[:]:
+            obstacle.move()
+            # Remove obstacles that are off screen
+            if obstacle.x + obstacle.width < 0:
+                self.obstacles.remove(obstacle)
+                self.score += 1
+
+            # Check collision
+            if (hen.x < obstacle.x + obstacle.width and
+                hen.x + hen.width > obstacle.x and
+                hen.y < obstacle.y + obstacle.height and
+                hen.y + hen.height > obstacle.y):
+                self.game_over = True
+                self.game_over_time = current_time
+
+def draw_frame(screen, font, game_over_font, hen, obstacles, score, intensity, game_over,
+               restart_prompt=True):
+    screen.fill(WHITE)
+
+    # Draw ground
+    pygame.draw.rect(screen, GREEN, (0, GROUND_HEIGHT, WINDOW_WIDTH, WINDOW_HEIGHT - GROUND_HEIGHT))
+
+    for obstacle in obstacles:
+        obstacle.draw(screen)
+
+    hen.draw(screen)
+
+    score_text = font.render(f"Score: {score}", True, BLACK)
+    screen.blit(score_text, (10, 10))
+
+    intensity_text = font.render(f"Sound Intensity: {intensity:.4f}", True, BLACK)
+    screen.blit(intensity_text, (10, 50))
+
+    if game_over:
+        game_over_text = game_over_font.render("Game Over!", True, BLACK)
+        screen.blit(game_over_text, (WINDOW_WIDTH//2 - game_over_text.get_width()//2, WINDOW_HEIGHT//2 - 50))
+        if restart_prompt:
+            restart_text = font.render("Press R to Restart", True, BLACK)
+            screen.blit(restart_text, (WINDOW_WIDTH//2 - restart_text.get_width()//2, WINDOW_HEIGHT//2 + 50))
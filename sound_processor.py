@@ -8,14 +8,14 @@ class SoundProcessor:
     def __init__(self):
         self.audio_queue = queue.Queue(maxsize=1)
         self.p = pyaudio.PyAudio()
-        self.stream = self.p.open(format=FORMAT,
+        self.stream = self.p.open(format=pyaudio.paFloat32,
                                  channels=CHANNELS,
                                  rate=RATE,
                                  input=True,
                                  frames_per_buffer=CHUNK_SIZE)
         self.running = True
         self.sound_buffer = []
-        self.buffer_size = 3
+        self.buffer_size = SOUND_BUFFER_SIZE
         
     def start(self):
         self.thread = threading.Thread(target=self._process_audio)
@@ -43,7 +43,7 @@ class SoundProcessor:
                 avg_intensity = np.mean(self.sound_buffer)
                 
                 # Apply minimal smoothing for faster response
-                smoothed_intensity = avg_intensity * 0.3 + amplified_rms * 0.7
+                smoothed_intensity = avg_intensity * SMOOTHING_AVG_WEIGHT + amplified_rms * SMOOTHING_CURRENT_WEIGHT
                 
                 # Clear old values from queue
                 while not self.audio_queue.empty():
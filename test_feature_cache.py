@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pytest
+
+import feature_cache
+from constants import *
+from feature_cache import FeatureCache, compute_intensity_envelope
+
+
+def replay_sound_processor(samples):
+    """Feed samples chunk by chunk through SoundProcessor's smoothing logic."""
+    sound_buffer = []
+    intensities = []
+    for i in range(len(samples) // CHUNK_SIZE):
+        audio_data = samples[i * CHUNK_SIZE:(i + 1) * CHUNK_SIZE]
+        rms = np.sqrt(np.mean(np.square(audio_data)))
+        amplified_rms = rms * SOUND_AMPLIFICATION
+        sound_buffer.append(amplified_rms)
+        if len(sound_buffer) > SOUND_BUFFER_SIZE:
+            sound_buffer.pop(0)
+        avg_intensity = np.mean(sound_buffer)
+        intensities.append(avg_intensity * SMOOTHING_AVG_WEIGHT + amplified_rms * SMOOTHING_CURRENT_WEIGHT)
+    return np.array(intensities, dtype=np.float32)
+
+
+@pytest.mark.parametrize("n_samples", [0, CHUNK_SIZE - 1, CHUNK_SIZE, 50 * CHUNK_SIZE + 100])
+def test_intensity_envelope_matches_sound_processor(n_samples):
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal(n_samples) * 0.1).astype(np.float32)
+
+    envelope = compute_intensity_envelope(samples)
+
+    assert envelope.shape == (n_samples // CHUNK_SIZE,)
+    np.testing.assert_allclose(envelope, replay_sound_processor(samples), rtol=1e-5, atol=1e-6)
+
+
+@pytest.fixture
+def fake_audio(tmp_path, monkeypatch):
+    """An audio file whose decoding is stubbed out, counting DSP runs."""
+    path = tmp_path / "session.wav"
+    path.write_bytes(b"not really audio")
+    samples = np.linspace(-0.5, 0.5, 10 * CHUNK_SIZE, dtype=np.float32)
+    loads = []
+
+    def load_audio(p):
+        loads.append(p)
+        return samples
+
+    monkeypatch.setattr(feature_cache, "load_audio", load_audio)
+    monkeypatch.setattr(feature_cache, "compute_onset_envelope",
+                        lambda s: np.zeros(len(s) // CHUNK_SIZE, dtype=np.float32))
+    return str(path), loads
+
+
+def test_get_hits_cache_until_dsp_params_change(tmp_path, fake_audio, monkeypatch):
+    path, loads = fake_audio
+    cache = FeatureCache(str(tmp_path / "cache"))
+
+    first = cache.get(path)
+    assert len(loads) == 1
+    assert isinstance(first["intensity"], np.memmap)
+    assert first["intensity"].shape == (10,)
+
+    second = cache.get(path)
+    assert len(loads) == 1
+    np.testing.assert_array_equal(first["intensity"], second["intensity"])
+
+    key = cache.key(path)
+    monkeypatch.setattr(feature_cache, "SOUND_AMPLIFICATION", SOUND_AMPLIFICATION * 2)
+    assert cache.key(path) != key
+
+    rescaled = cache.get(path)
+    assert len(loads) == 2
+    np.testing.assert_allclose(rescaled["intensity"], np.asarray(first["intensity"]) * 2, rtol=1e-5)
+
+
+def _write_entry(cache, key, last_used):
+    for feature in feature_cache.FEATURES:
+        entry = cache._entry_path(key, feature)
+        np.save(entry, np.zeros(100, dtype=np.float32))
+        os.utime(entry, (last_used, last_used))
+    return sum(os.path.getsize(cache._entry_path(key, f)) for f in feature_cache.FEATURES)
+
+
+def _cached_keys(cache):
+    return {name.split(".", 1)[0] for name in os.listdir(cache.cache_dir)}
+
+
+@pytest.mark.parametrize("keep, expected", [(None, {"b", "c"}), ("a", {"a", "c"})])
+def test_evict_drops_least_recently_used(tmp_path, keep, expected):
+    cache = FeatureCache(str(tmp_path / "cache"))
+    entry_size = 0
+    for key, last_used in (("a", 100), ("b", 200), ("c", 300)):
+        entry_size = _write_entry(cache, key, last_used)
+
+    cache.max_bytes = 2 * entry_size
+    cache.evict(keep=keep)
+
+    assert _cached_keys(cache) == expected